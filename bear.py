@@ -11,11 +11,20 @@ from time import sleep, time
 import logging
 from datetime import datetime
 import sounddevice as sd
+import soundfile as sf
 import numpy as np
 import rtmidi
 from pathlib import Path
+from collections import defaultdict
 import subprocess
 import multiprocessing
+import threading
+import queue
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy mix path still works
+    njit = None
 
 # Set up logging
 log_filename = f"bearsampler_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
@@ -46,7 +55,7 @@ HARDWARE_CONFIG = {
         'DEVICE_NAME': 'PirateAudio',
         'SAMPLE_RATE': 44100,
         'CHANNELS': 2,
-        'BLOCKSIZE': 1024,
+        'BLOCKSIZE': 256,   # ~5.8 ms per block at 44.1 kHz
         'FORMAT': 'float32',
         'DAC_SETTINGS': {
             'GPIO_SETTINGS': {
@@ -86,6 +95,21 @@ COLORS = {
     'crystal': (255, 180, 180)     # Crystal highlight
 }
 
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _mix_voice(mixed, sample, pos, n, gain,
+                   releasing, release_env, release_pos):
+        """Accumulate one voice into the mix buffer (compiled to native)"""
+        for i in range(n):
+            g = gain
+            if releasing:
+                g = gain * release_env[release_pos + i]
+            mixed[i, 0] += sample[pos + i, 0] * g
+            mixed[i, 1] += sample[pos + i, 1] * g
+else:
+    _mix_voice = None
+
+
 class SystemSetup:
     @staticmethod
     def setup_audio_config():
@@ -178,8 +202,12 @@ class SystemSetup:
             sample_rate = 44100
             duration = 1
             frequency = 440
-            t = np.linspace(0, duration, int(sample_rate * duration), False)
-            test_tone = np.sin(2 * np.pi * frequency * t)
+            # Fold the angular frequency into the sample grid and stay
+            # in float32 end to end; one buffer, no float64 intermediates
+            phase = np.arange(int(sample_rate * duration),
+                              dtype=np.float32)
+            phase *= np.float32(2 * np.pi * frequency / sample_rate)
+            test_tone = np.sin(phase, out=phase)
 
             sd.play(test_tone, sample_rate)
             sd.wait()
@@ -213,11 +241,71 @@ class DisplayManager:
         try:
             self.disp.begin()
             self.load_fonts()
+            self._check_spi_buffer()
+            # Single-transfer path needs the driver's raw window/send API
+            self._fast_blit = (hasattr(self.disp, 'set_window')
+                               and hasattr(self.disp, 'send'))
+            # Scratch buffers reused by the RGB565 packer every frame
+            self._rgb_work = np.empty((self.height, self.width),
+                                      dtype=np.uint16)
+            self._rgb_tmp = np.empty((self.height, self.width),
+                                     dtype=np.uint16)
+            self._rgb_out = np.empty((self.height, self.width), dtype='>u2')
             logging.info("Display initialized successfully")
         except Exception as e:
             logging.error(f"Display initialization error: {e}")
             raise
 
+    def _check_spi_buffer(self):
+        """Warn when spidev's buffer forces chunked framebuffer writes"""
+        frame_bytes = self.width * self.height * 2
+        try:
+            with open('/sys/module/spidev/parameters/bufsiz') as f:
+                bufsiz = int(f.read().strip())
+        except (OSError, ValueError):
+            return
+        if bufsiz < frame_bytes:
+            logging.warning(
+                f"spidev bufsiz is {bufsiz} but a frame is {frame_bytes} "
+                "bytes; add spidev.bufsiz=131072 to /boot/cmdline.txt to "
+                "push frames in a single SPI transfer")
+
+    def show(self, image):
+        """Display a full frame, using one SPI transfer when possible"""
+        if self._fast_blit:
+            try:
+                buf = self._to_rgb565(image)
+                self.disp.set_window(0, 0, self.width - 1, self.height - 1)
+                self.disp.send(buf, True, chunk_size=len(buf))
+                return
+            except Exception as e:
+                logging.warning(
+                    f"Single-transfer display failed, falling back: {e}")
+                self._fast_blit = False
+        self.disp.display(image)
+
+    def _to_rgb565(self, image):
+        """Pack a PIL image into the panel's big-endian RGB565 format"""
+        arr = np.asarray(image.convert('RGB'))
+        out = self._rgb_work
+        tmp = self._rgb_tmp
+
+        # All shifts and masks run in place on the reused scratch buffers
+        out[:] = arr[..., 0]
+        out >>= 3
+        out <<= 11
+        tmp[:] = arr[..., 1]
+        tmp >>= 2
+        tmp <<= 5
+        out |= tmp
+        tmp[:] = arr[..., 2]
+        tmp >>= 3
+        out |= tmp
+
+        # Assignment into the big-endian buffer performs the byte swap
+        self._rgb_out[:] = out
+        return self._rgb_out.tobytes()
+
     def load_fonts(self):
         """Load system fonts or fall back to default"""
         try:
@@ -240,9 +328,59 @@ class AudioEngine:
         self.blocksize = config['AUDIO']['BLOCKSIZE']
         self.format = config['AUDIO']['FORMAT']
         self.stream = None
-        self.playing_notes = {}
         self.volume = 0.8
-        self.samples = {}
+        # (note map, flat sample bank) published as one tuple; the map
+        # is note -> (start, length) into the flat array. A single
+        # assignment swaps both together, so a reader can never pair an
+        # old map with a new bank
+        self._bank = ({}, np.zeros((0, 2), dtype=np.float32))
+        self._running = False
+        self._producer_thread = None
+
+        # Voice pool stored as parallel arrays so the callback can mix
+        # without per-voice dict lookups or string keys. Each voice keeps
+        # a reference to the bank it started in, so preset swaps never
+        # pull samples out from under a sounding note
+        self.max_polyphony = config['SYSTEM']['MAX_POLYPHONY']
+        self._voice_banks = [None] * self.max_polyphony
+        self._starts = np.zeros(self.max_polyphony, dtype=np.int64)
+        self._notes = np.zeros(self.max_polyphony, dtype=np.int16)
+        self._positions = np.zeros(self.max_polyphony, dtype=np.int64)
+        self._lengths = np.zeros(self.max_polyphony, dtype=np.int64)
+        self._gains = np.zeros(self.max_polyphony, dtype=np.float32)
+        self._releasing = np.zeros(self.max_polyphony, dtype=bool)
+        self._release_pos = np.zeros(self.max_polyphony, dtype=np.int64)
+
+        # Free-list allocation: note_on pops a slot, finished voices push
+        # it back. The note index makes note_off O(voices per pitch).
+        # Active slots live in a preallocated array compacted in place,
+        # so the mix loop never copies a Python container
+        self._free = list(range(self.max_polyphony))
+        self._active_slots = np.empty(self.max_polyphony, dtype=np.int32)
+        self._n_active = 0
+        self._note_to_slots = defaultdict(list)
+
+        # Release envelope computed once at init and sliced per block
+        release_time = 0.1  # seconds
+        self._release_env = np.linspace(
+            1.0, 0.0, int(release_time * self.sample_rate), dtype=np.float32)
+
+        # Reusable block buffers so the steady-state audio path never
+        # allocates
+        self._mix_buf = np.empty((self.blocksize, self.channels),
+                                 dtype=np.float32)
+        self._silence = np.zeros((self.blocksize, self.channels),
+                                 dtype=np.float32)
+
+        # MIDI callbacks run on rtmidi's thread; they only enqueue events
+        # here and the producer applies them at the top of each block, so
+        # the voice arrays are touched by a single thread
+        self._events = queue.SimpleQueue()
+
+    @property
+    def active_voices(self):
+        """Number of currently sounding voices"""
+        return self._n_active
 
     def initialize(self):
         """Initialize audio system"""
@@ -251,88 +389,201 @@ class AudioEngine:
             sd.default.channels = self.channels
             sd.default.blocksize = self.blocksize
 
+            if _mix_voice is not None:
+                # Trigger JIT compilation before the stream exists; a
+                # cold-cache compile can take seconds and an already
+                # running stream would underrun the whole time
+                _mix_voice(self._mix_buf, self._silence, 0, 1, 0.0,
+                           False, self._release_env, 0)
+                self._mix_buf.fill(0.0)
+
+            # latency='low' keeps PortAudio's internal buffer shallow;
+            # with blocking writes the producer fills whatever depth the
+            # host offers, so a deep buffer would turn straight into
+            # key-to-sound delay
             self.stream = sd.OutputStream(
                 channels=self.channels,
-                callback=self.audio_callback,
                 samplerate=self.sample_rate,
-                blocksize=self.blocksize
+                blocksize=self.blocksize,
+                dtype='float32',
+                latency='low'
             )
             self.stream.start()
+
+            # Mixing happens on our own producer thread; stream.write()
+            # blocks inside PortAudio so the real audio thread never has
+            # to take the GIL
+            self._running = True
+            self._producer_thread = threading.Thread(
+                target=self._producer, daemon=True)
+            self._producer_thread.start()
+
             logging.info("Audio engine initialized successfully")
             return True
         except Exception as e:
             logging.error(f"Audio initialization error: {e}")
             return False
 
-    def audio_callback(self, outdata, frames, time, status):
-        """Real-time audio callback"""
-        if status:
-            logging.warning(f"Audio callback status: {status}")
+    @staticmethod
+    def _elevate_priority():
+        """Ask for real-time scheduling on the mix thread; best effort"""
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+        except (AttributeError, PermissionError, OSError) as e:
+            logging.info(f"Real-time scheduling unavailable: {e}")
+
+    def _producer(self):
+        """Mix blocks and feed them to the stream with blocking writes"""
+        self._elevate_priority()
+        frames = self.blocksize
+        mixed = self._mix_buf
 
+        while self._running:
+            try:
+                self._drain_events()
+                mixed.fill(0.0)
+                self._mix_block(mixed, frames)
+                self.stream.write(mixed)
+            except sd.PortAudioError:
+                # Stream was aborted/closed during shutdown
+                break
+            except Exception as e:
+                logging.error(f"Audio producer error: {e}")
+                try:
+                    self.stream.write(self._silence)
+                except sd.PortAudioError:
+                    break
+
+    def _mix_block(self, mixed, frames):
+        """Mix all active voices into the given buffer"""
         try:
-            # Initialize output buffer
-            mixed = np.zeros((frames, self.channels), dtype=np.float32)
-
-            # Mix all active notes
-            for note_id, note_data in list(self.playing_notes.items()):
-                pos = note_data['position']
-                sample = note_data['sample']
-                velocity = note_data['velocity']
-                release = note_data.get('release', False)
-
-                if pos >= len(sample):
-                    del self.playing_notes[note_id]
+            # Mix all active voice slots; finished voices are removed by
+            # swapping the last slot into their place, so iteration stays
+            # in the preallocated array
+            i = 0
+            while i < self._n_active:
+                slot = int(self._active_slots[i])
+                pos = int(self._positions[slot])
+                length = int(self._lengths[slot])
+
+                if pos >= length:
+                    self._retire_voice(i)
                     continue
 
                 # Calculate number of samples to mix
-                available = len(sample) - pos
-                n_samples = min(frames, available)
-
-                # Apply volume and velocity scaling
-                gain = (velocity / 127.0) * self.volume
-                if release:
-                    # Apply release envelope
-                    release_samples = note_data['release_samples']
-                    release_pos = note_data['release_pos']
-                    env = np.linspace(1.0, 0.0, release_samples)[release_pos:release_pos+n_samples]
-                    gain *= env[:n_samples]
-                    note_data['release_pos'] += n_samples
-
-                # Mix into output buffer
-                mixed[:n_samples] += sample[pos:pos+n_samples] * gain
+                n_samples = min(frames, length - pos)
+                gain = float(self._gains[slot]) * self.volume
+                releasing = bool(self._releasing[slot])
+                release_pos = int(self._release_pos[slot])
+                finished = False
+
+                if releasing:
+                    env_left = self._release_env.size - release_pos
+                    if env_left <= 0:
+                        self._retire_voice(i)
+                        continue
+                    if env_left <= n_samples:
+                        # Release tail ends inside this block
+                        n_samples = env_left
+                        finished = True
+
+                bank = self._voice_banks[slot]
+                base = int(self._starts[slot]) + pos
+                if _mix_voice is not None:
+                    _mix_voice(mixed, bank, base, n_samples, gain,
+                               releasing, self._release_env, release_pos)
+                else:
+                    chunk = bank[base:base+n_samples] * gain
+                    if releasing:
+                        chunk *= self._release_env[
+                            release_pos:release_pos+n_samples, np.newaxis]
+                    mixed[:n_samples] += chunk
+
+                if finished:
+                    self._retire_voice(i)
+                    continue
 
-                # Update position
-                note_data['position'] += n_samples
+                # Update positions
+                self._positions[slot] = pos + n_samples
+                if releasing:
+                    self._release_pos[slot] = release_pos + n_samples
+                i += 1
 
             # Prevent clipping
-            mixed = np.clip(mixed, -1.0, 1.0)
-            outdata[:] = mixed
+            np.clip(mixed, -1.0, 1.0, out=mixed)
 
         except Exception as e:
-            logging.error(f"Audio callback error: {e}")
-            outdata.fill(0)
+            logging.error(f"Audio mix error: {e}")
+            mixed.fill(0)
+
+    def set_samples(self, note_map, samples_flat):
+        """Install a new sample bank (note -> (start, length))"""
+        self._bank = (note_map, samples_flat)
+
+    def _retire_voice(self, index):
+        """Return the voice at an active index to the pool (swap-with-last)"""
+        slot = int(self._active_slots[index])
+        self._voice_banks[slot] = None
+        self._n_active -= 1
+        self._active_slots[index] = self._active_slots[self._n_active]
+        self._free.append(slot)
+
+        # Drop the slot from the note index if note_off never came
+        slots = self._note_to_slots.get(int(self._notes[slot]))
+        if slots and slot in slots:
+            slots.remove(slot)
+
+    def _drain_events(self):
+        """Apply queued note events; runs on the producer thread only"""
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                return
+            if event[0] == 'on':
+                self._start_voice(event[1], event[2])
+            else:
+                self._release_note(event[1])
 
     def note_on(self, note, velocity):
-        """Start playing a note"""
-        if note in self.samples:
-            note_id = f"{note}_{time()}"
-            self.playing_notes[note_id] = {
-                'sample': self.samples[note],
-                'position': 0,
-                'velocity': velocity,
-                'release': False
-            }
+        """Queue a note start; safe to call from any thread"""
+        self._events.put(('on', note, velocity))
 
     def note_off(self, note):
-        """Stop playing a note with release"""
-        release_time = 0.1  # seconds
-        release_samples = int(release_time * self.sample_rate)
-
-        for note_id in list(self.playing_notes.keys()):
-            if note_id.startswith(f"{note}_"):
-                self.playing_notes[note_id]['release'] = True
-                self.playing_notes[note_id]['release_samples'] = release_samples
-                self.playing_notes[note_id]['release_pos'] = 0
+        """Queue a note release; safe to call from any thread"""
+        self._events.put(('off', note))
+
+    def _start_voice(self, note, velocity):
+        """Allocate and initialise a voice slot for a note"""
+        # Read the published bank exactly once so the map and the flat
+        # array are guaranteed to belong together
+        note_map, samples_flat = self._bank
+        entry = note_map.get(note)
+        if entry is None:
+            return
+
+        if not self._free:
+            return  # polyphony limit reached
+
+        start, length = entry
+        slot = self._free.pop()
+        self._voice_banks[slot] = samples_flat
+        self._starts[slot] = start
+        self._notes[slot] = note
+        self._positions[slot] = 0
+        self._lengths[slot] = length
+        self._gains[slot] = velocity / 127.0
+        self._releasing[slot] = False
+        self._release_pos[slot] = 0
+        self._active_slots[self._n_active] = slot
+        self._n_active += 1
+        self._note_to_slots[note].append(slot)
+
+    def _release_note(self, note):
+        """Put every voice playing a note into its release phase"""
+        for slot in self._note_to_slots.pop(note, ()):
+            self._releasing[slot] = True
+            self._release_pos[slot] = 0
 
     def set_volume(self, volume):
         """Set master volume"""
@@ -340,9 +591,15 @@ class AudioEngine:
 
     def cleanup(self):
         """Clean up audio resources"""
+        self._running = False
         if self.stream:
-            self.stream.stop()
+            # abort() unblocks a producer stuck in stream.write()
+            self.stream.abort()
+            if self._producer_thread:
+                self._producer_thread.join(timeout=1.0)
             self.stream.close()
+            self.stream = None
+        self._producer_thread = None
 
 
 class MIDIHandler:
@@ -419,6 +676,23 @@ class SampleManager:
         self.audio_engine = audio_engine
         self.sample_path = Path("/media/usb/BearSampler")
         self.current_preset = 0
+        self._loader_thread = None
+
+    def load_preset_async(self, preset_number):
+        """Decode a preset on a background thread and swap it in
+
+        Decoding happens entirely off to the side (soundfile and NumPy
+        release the GIL for the heavy work) and the only thing the audio
+        side ever sees is the atomic bank swap in set_samples, so preset
+        changes no longer stall the UI or glitch playback.
+        """
+        if self._loader_thread and self._loader_thread.is_alive():
+            logging.info("Preset load already in progress, ignoring request")
+            return False
+        self._loader_thread = threading.Thread(
+            target=self.load_preset, args=(preset_number,), daemon=True)
+        self._loader_thread.start()
+        return True
 
     def load_preset(self, preset_number):
         """Load samples for the specified preset"""
@@ -428,24 +702,37 @@ class SampleManager:
                 logging.warning(f"Preset directory not found: {preset_dir}")
                 return False
 
-            # Clear existing samples
-            self.audio_engine.samples.clear()
-
-            # Load new samples
-            for sample_file in preset_dir.glob("*.wav"):
+            # Decode every sample to C-contiguous float32 stereo and
+            # concatenate into one flat bank the mix kernel can index
+            chunks = []
+            note_map = {}
+            start = 0
+            for sample_file in sorted(preset_dir.glob("*.wav")):
                 try:
                     note = self.get_note_from_filename(sample_file.name)
-                    if note is not None:
-                        audio_data, _ = sd.read(str(sample_file))
-                        if len(audio_data.shape) == 1:
-                            # Convert mono to stereo
-                            audio_data = np.column_stack((audio_data, audio_data))
-                        self.audio_engine.samples[note] = audio_data
+                    if note is None:
+                        continue
+                    data, _ = sf.read(str(sample_file), dtype='float32',
+                                      always_2d=True)
+                    if data.shape[1] == 1:
+                        # Convert mono to stereo
+                        data = np.repeat(data, 2, axis=1)
+                    data = np.ascontiguousarray(data[:, :2],
+                                                dtype=np.float32)
+                    chunks.append(data)
+                    note_map[note] = (start, len(data))
+                    start += len(data)
                 except Exception as e:
                     logging.error(f"Error loading sample {sample_file}: {e}")
 
+            if chunks:
+                samples_flat = np.concatenate(chunks, axis=0)
+            else:
+                samples_flat = np.zeros((0, 2), dtype=np.float32)
+            self.audio_engine.set_samples(note_map, samples_flat)
+
             self.current_preset = preset_number
-            logging.info(f"Loaded preset {preset_number} with {len(self.audio_engine.samples)} samples")
+            logging.info(f"Loaded preset {preset_number} with {len(note_map)} samples")
             return True
 
         except Exception as e:
@@ -472,10 +759,22 @@ class Visualizer:
         self.viz_heights = [0] * self.viz_bars
         self.viz_targets = [0] * self.viz_bars
         self.viz_speed = 0.3
+        self.max_bar_height = 60
+        # Bars are rendered into this buffer and pasted in one call
+        self._bar_buf = np.zeros((self.max_bar_height, width, 3),
+                                 dtype=np.uint8)
+        # get_fire_color is pure, so sample it once into a 256-entry LUT
+        # and derive the per-row gradient of a full-height bar from it
+        self._fire_lut = np.array(
+            [self.get_fire_color(i / 255) for i in range(256)],
+            dtype=np.uint8)
+        mbh = self.max_bar_height
+        self._bar_column = self._fire_lut[
+            [(h * 255) // mbh for h in range(mbh - 1, -1, -1)]]
 
     def update(self, audio_engine):
         """Update visualization based on currently playing notes"""
-        if audio_engine.playing_notes:
+        if audio_engine.active_voices:
             for i in range(self.viz_bars):
                 if random.random() < 0.3:
                     self.viz_targets[i] = random.uniform(0.3, 1.0)
@@ -486,35 +785,41 @@ class Visualizer:
                 self.viz_heights[i] = max(0, self.viz_heights[i] - 0.05)
                 self.viz_targets[i] = 0
 
-    def draw(self, draw, base_y):
+    def draw(self, image, base_y):
         """Draw visualization bars with fire effect"""
         bar_width = (self.width - 40) // self.viz_bars
         bar_spacing = 4
-        max_bar_height = 60
+        mbh = self.max_bar_height
+
+        buf = self._bar_buf
+        buf[:] = 0
+
+        column = self._bar_column
+        flicker = np.random.random(self.viz_bars) < 0.3
 
         for i in range(self.viz_bars):
-            bar_height = int(self.viz_heights[i] * max_bar_height)
-            if bar_height > 0:
-                x = 20 + i * (bar_width + bar_spacing)
-                for h in range(bar_height):
-                    height_percent = h / max_bar_height
-                    color = self.get_fire_color(height_percent)
-                    draw.line(
-                        [(x, base_y - h), (x + bar_width - bar_spacing, base_y - h)],
-                        fill=color
-                    )
-
-                    # Add flicker effect
-                    if h == bar_height - 1 and random.random() < 0.3:
-                        flicker_height = random.randint(2, 5)
-                        for fh in range(flicker_height):
-                            flicker_color = self.get_fire_color(min(1.0, height_percent + 0.2))
-                            if random.random() < 0.7:
-                                draw.line(
-                                    [(x, base_y - h - fh),
-                                     (x + bar_width - bar_spacing, base_y - h - fh)],
-                                    fill=flicker_color
-                                )
+            bar_height = int(self.viz_heights[i] * mbh)
+            if bar_height <= 0:
+                continue
+
+            x = 20 + i * (bar_width + bar_spacing)
+            top = mbh - bar_height
+            buf[top:, x:x + bar_width - bar_spacing] = \
+                column[mbh - bar_height:, np.newaxis, :]
+
+            # Flicker above the bar tip
+            if flicker[i]:
+                flicker_height = random.randint(2, 5)
+                flicker_color = self._fire_lut[
+                    min(255, (bar_height * 255) // mbh + 51)]
+                buf[max(0, top - flicker_height):top,
+                    x:x + bar_width - bar_spacing] = flicker_color
+
+        # Single paste instead of one draw.line call per pixel row; the
+        # mask keeps the background visible around the bars
+        bars = Image.fromarray(buf, 'RGB')
+        mask = Image.fromarray(buf.any(axis=2).astype(np.uint8) * 255, 'L')
+        image.paste(bars, (0, base_y - mbh), mask)
 
     @staticmethod
     def get_fire_color(height_percent):
@@ -541,24 +846,44 @@ class UIManager:
         self.scroll_pause = 30
         self.scroll_pause_counter = 0
         self.scroll_width = 200
+        # Text widths are cached per (font, text); the set of strings the
+        # UI shows is small, so the cache never needs invalidating
+        self._textw_cache = {}
+        # Rendered text tiles for labels that repeat every frame
+        self._label_cache = {}
+        # Redraw at most every _min_dt and skip frames whose visible
+        # state has not changed
+        self._last_draw = 0.0
+        self._min_dt = 0.1
+        self._state_hash = None
+
+        # The background (solid fill + gradient overlay) never changes,
+        # so render it once and copy it per frame. The overlay is a
+        # solid strip, pasted in one call rather than drawn row by row
+        self._bg_template = Image.new(
+            'RGB', (self.width, self.height), COLORS['background'])
+        self._bg_template.paste(
+            Image.new('RGB', (self.width, 100), (80, 0, 0)),
+            (0, self.height - 100))
 
     def create_base_image(self):
         """Create base image with background gradient"""
-        image = Image.new('RGB', (self.width, self.height), COLORS['background'])
-        draw = ImageDraw.Draw(image)
-
-        # Add crystal gradient overlay
-        for y in range(self.height - 100, self.height):
-            opacity = int((y - (self.height - 100)) / 100 * 160)
-            color = (80, 0, 0)
-            draw.line([(0, y), (self.width, y)], fill=color)
-
-        return image, draw
+        image = self._bg_template.copy()
+        return image, ImageDraw.Draw(image)
+
+    def _text_width(self, draw, text, font):
+        """Measure text width, caching per (font, text)"""
+        key = (id(font), text)
+        width = self._textw_cache.get(key)
+        if width is None:
+            text_bbox = draw.textbbox((0, 0), text, font=font)
+            width = text_bbox[2] - text_bbox[0]
+            self._textw_cache[key] = width
+        return width
 
     def draw_scrolling_text(self, draw, text, x, y, font, fill_color, shadow_color):
         """Draw scrolling text with shadow effect"""
-        text_bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
+        text_width = self._text_width(draw, text, font)
 
         if text_width > self.scroll_width:
             if self.scroll_pause_counter > 0:
@@ -580,37 +905,75 @@ class UIManager:
             draw.text((x + 2, y + 2), text, font=font, fill=shadow_color)
             draw.text((x, y), text, font=font, fill=fill_color)
 
+    def _label(self, text, font, fill):
+        """Lazily render a text tile and cache it for pasting"""
+        key = (text, id(font), fill)
+        tile = self._label_cache.get(key)
+        if tile is None:
+            measure = ImageDraw.Draw(self._bg_template)
+            bbox = measure.textbbox((0, 0), text, font=font)
+            tile = Image.new('RGBA', (bbox[2] + 1, bbox[3] + 1), (0, 0, 0, 0))
+            ImageDraw.Draw(tile).text((0, 0), text, font=font, fill=fill)
+            self._label_cache[key] = tile
+        return tile
+
     def update_display(self, state):
         """Update display with current state"""
+        now = time()
+        if now - self._last_draw < self._min_dt:
+            return
+
+        engine = state.audio_engine
+        time_text = datetime.now().strftime("%H:%M:%S")
+        state_hash = (
+            state.sample_manager.current_preset,
+            engine.active_voices,
+            round(engine.volume, 2),
+            state.midi_handler.midi_in is not None,
+            time_text,
+        )
+        # While voices play the visualizer animates every frame, so only
+        # skip unchanged frames when the engine is idle
+        if engine.active_voices == 0 and state_hash == self._state_hash:
+            return
+        self._state_hash = state_hash
+        self._last_draw = now
+
         image, draw = self.create_base_image()
 
         # Update visualization
         self.visualizer.update(state.audio_engine)
-        self.visualizer.draw(draw, self.height - 10)
-
-        # Draw preset information
-        preset_text = f"Preset: {state.sample_manager.current_preset}"
-        draw.text((20, 20), preset_text, font=self.display.font_medium, fill=COLORS['text'])
-
-        # Draw active notes
-        notes_text = f"Active Notes: {len(state.audio_engine.playing_notes)}"
-        draw.text((20, 60), notes_text, font=self.display.font_small, fill=COLORS['text'])
-
-        # Draw volume
-        vol_text = f"Volume: {int(state.audio_engine.volume * 100)}%"
-        draw.text((20, 100), vol_text, font=self.display.font_small, fill=COLORS['crystal'])
-
-        # Draw MIDI status
-        midi_text = "MIDI: Connected" if state.midi_handler.midi_in else "MIDI: Not Connected"
-        draw.text((20, 140), midi_text, font=self.display.font_small,
-                 fill=COLORS['glow'] if state.midi_handler.midi_in else COLORS['accent'])
+        self.visualizer.draw(image, self.height - 10)
+
+        # Static label parts come from the tile cache; only the variable
+        # values are rasterized per frame
+        label = self._label("Preset: ", self.display.font_medium, COLORS['text'])
+        image.paste(label, (20, 20), label)
+        draw.text((20 + label.width, 20), str(state.sample_manager.current_preset),
+                  font=self.display.font_medium, fill=COLORS['text'])
+
+        label = self._label("Active Notes: ", self.display.font_small, COLORS['text'])
+        image.paste(label, (20, 60), label)
+        draw.text((20 + label.width, 60), str(engine.active_voices),
+                  font=self.display.font_small, fill=COLORS['text'])
+
+        label = self._label("Volume: ", self.display.font_small, COLORS['crystal'])
+        image.paste(label, (20, 100), label)
+        draw.text((20 + label.width, 100), f"{int(engine.volume * 100)}%",
+                  font=self.display.font_small, fill=COLORS['crystal'])
+
+        # MIDI status only has two variants, so cache the whole line
+        midi_connected = state.midi_handler.midi_in is not None
+        midi_text = "MIDI: Connected" if midi_connected else "MIDI: Not Connected"
+        label = self._label(midi_text, self.display.font_small,
+                            COLORS['glow'] if midi_connected else COLORS['accent'])
+        image.paste(label, (20, 140), label)
 
         # Draw current time
-        time_text = datetime.now().strftime("%H:%M:%S")
         draw.text((20, 180), time_text, font=self.display.font_small, fill=COLORS['text'])
 
         # Update display
-        self.display.disp.display(image)
+        self.display.show(image)
 
 
 class InputHandler:
@@ -623,6 +986,10 @@ class InputHandler:
             'X': {'pressed': False, 'time': 0},
             'Y': {'pressed': False, 'time': 0}
         }
+        self._pin_to_name = {pin: name for name, pin in buttons_config.items()}
+        # Edge events arrive on GPIO's callback thread and are drained
+        # from the main loop
+        self._events = queue.SimpleQueue()
 
     def initialize(self):
         """Initialize GPIO for buttons"""
@@ -630,37 +997,63 @@ class InputHandler:
             GPIO.setmode(GPIO.BCM)
             for button in self.buttons.values():
                 GPIO.setup(button, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+                GPIO.add_event_detect(button, GPIO.BOTH,
+                                      callback=self._on_edge, bouncetime=20)
             return True
         except Exception as e:
             logging.error(f"Button initialization error: {e}")
             return False
 
-    def check_buttons(self):
-        """Check button states and return events"""
+    def _on_edge(self, pin):
+        """GPIO edge callback; keep it tiny and allocation-light"""
+        name = self._pin_to_name.get(pin)
+        if name is None:
+            return
+        # Buttons are pulled up, so a low level means pressed
+        kind = 'press' if not GPIO.input(pin) else 'release'
+        self._events.put((name, kind, time()))
+
+    def _translate(self, name, kind, ts):
+        """Turn a raw edge into a press/short/long event, or None"""
+        prev_state = self.button_states[name]
+        if kind == 'press' and not prev_state['pressed']:
+            prev_state['pressed'] = True
+            prev_state['time'] = ts
+            return (name, 'press')
+        if kind == 'release' and prev_state['pressed']:
+            prev_state['pressed'] = False
+            held = ts - prev_state['time']
+            if held >= self.long_press_time:
+                return (name, 'long_press')
+            return (name, 'short_press')
+        return None
+
+    def check_buttons(self, timeout=None):
+        """Drain queued edge events and return button events
+
+        With a timeout the call blocks until the first edge arrives or
+        the timeout lapses, so the caller can sleep between inputs
+        instead of polling at a fixed rate.
+        """
         events = []
-        current_time = time()
-
-        for name, pin in self.buttons.items():
-            button_state = not GPIO.input(pin)
-            prev_state = self.button_states[name]
-
-            if button_state and not prev_state['pressed']:
-                # Button just pressed
-                prev_state['pressed'] = True
-                prev_state['time'] = current_time
-                events.append((name, 'press'))
-
-            elif button_state and prev_state['pressed']:
-                # Check for long press
-                if current_time - prev_state['time'] >= self.long_press_time:
-                    events.append((name, 'long_press'))
-                    prev_state['time'] = current_time
-
-            elif not button_state and prev_state['pressed']:
-                # Button released
-                prev_state['pressed'] = False
-                if current_time - prev_state['time'] < self.long_press_time:
-                    events.append((name, 'short_press'))
+
+        if timeout is not None:
+            try:
+                name, kind, ts = self._events.get(timeout=timeout)
+            except queue.Empty:
+                return events
+            event = self._translate(name, kind, ts)
+            if event:
+                events.append(event)
+
+        while True:
+            try:
+                name, kind, ts = self._events.get_nowait()
+            except queue.Empty:
+                break
+            event = self._translate(name, kind, ts)
+            if event:
+                events.append(event)
 
         return events
 
@@ -761,7 +1154,7 @@ class BearSampler:
                  font=self.display_manager.font_small,
                  fill=COLORS['text'])
 
-        self.display_manager.disp.display(image)
+        self.display_manager.show(image)
 
     def show_error_screen(self, error_message):
         """Display error screen"""
@@ -798,7 +1191,7 @@ class BearSampler:
                      fill=COLORS['text'])
             y += 20
 
-        self.display_manager.disp.display(image)
+        self.display_manager.show(image)
 
     def handle_button_events(self, events):
         """Process button events"""
@@ -815,7 +1208,7 @@ class BearSampler:
                     if button == 'A':
                         # Previous preset
                         new_preset = max(0, self.sample_manager.current_preset - 1)
-                        self.sample_manager.load_preset(new_preset)
+                        self.sample_manager.load_preset_async(new_preset)
 
                     elif button == 'B':
                         # Play/Stop test tone
@@ -823,7 +1216,7 @@ class BearSampler:
 
                     elif button == 'X':
                         # Next preset
-                        self.sample_manager.load_preset(
+                        self.sample_manager.load_preset_async(
                             self.sample_manager.current_preset + 1)
 
                     elif button == 'Y':
@@ -861,7 +1254,7 @@ class BearSampler:
                  font=self.display_manager.font_medium,
                  fill=COLORS['glow'])
 
-        self.display_manager.disp.display(image)
+        self.display_manager.show(image)
 
     def run(self):
         """Main program loop"""
@@ -873,26 +1266,35 @@ class BearSampler:
             last_update = time()
             update_interval = 1/30  # 30 FPS
 
-            while self.state.is_running:
+            # Bind the hot-loop callables and state to locals once;
+            # LOAD_ATTR per iteration is measurable on the Pi's
+            # interpreter
+            _time = time
+            state = self.state
+            check = self.input_handler.check_buttons
+            handle = self.handle_button_events
+            check_sleep = self.check_sleep_mode
+            update = self.ui_manager.update_display
+
+            while state.is_running:
                 try:
-                    # Handle button input
-                    events = self.input_handler.check_buttons()
+                    # Block on the button event queue until an edge
+                    # arrives or the frame budget lapses; the loop only
+                    # wakes for input or the next display tick
+                    events = check(timeout=update_interval)
                     if events:
-                        self.handle_button_events(events)
+                        handle(events)
 
                     # Check sleep mode
-                    self.check_sleep_mode()
+                    check_sleep()
 
                     # Update display if not sleeping
-                    current_time = time()
-                    if not self.state.is_sleeping and \
+                    current_time = _time()
+                    if not state.is_sleeping and \
                        current_time - last_update >= update_interval:
-                        self.ui_manager.update_display(self)
+                        update(self)
                         last_update = current_time
 
-                    # Small sleep to prevent CPU overload
-                    sleep(0.01)
-
                 except Exception as e:
                     logging.error(f"Loop iteration error: {e}")
                     self.state.error_count += 1
@@ -1,102 +1,80 @@
 #!/usr/bin/env python3
 
+import atexit
+import hashlib
+import math
+import os
 import time
 import pygame
 import RPi.GPIO as GPIO
 import numpy as np
-import wave
 import struct
 
-def setup_dac():
-    """Configure GPIO for the PCM5102A DAC"""
-    try:
-        GPIO.setmode(GPIO.BCM)
-        # Set GPIO 25 high to enable the DAC
-        GPIO.setup(25, GPIO.OUT)
-        GPIO.output(25, GPIO.HIGH)
-        return True
-    except Exception as e:
-        print(f"DAC setup error: {e}")
-        return False
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; fall back to the NumPy synthesis path
+    njit = None
 
-def generate_test_tone():
-    """Generate a test tone WAV file"""
-    # Audio parameters
-    sample_rate = 44100
-    duration = 2  # seconds
-    frequency = 440  # Hz (A4 note)
-    amplitude = 0.5  # 50% volume
-    
-    # Generate samples
-    samples = amplitude * np.sin(2.0 * np.pi * frequency * np.linspace(0, duration, int(duration * sample_rate)))
-    
-    # Convert to 16-bit integers
-    samples = (samples * 32767).astype(np.int16)
-    
-    # Write WAV file
-    with wave.open('test_tone.wav', 'w') as wav_file:
-        # Set parameters
-        wav_file.setnchannels(1)  # Mono
-        wav_file.setsampwidth(2)  # 2 bytes per sample
-        wav_file.setframerate(sample_rate)
-        
-        # Write data
-        wav_file.writeframes(samples.tobytes())
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _fill_tone(out, frequency, sample_rate, amplitude):
+        """Write an int16 sine tone directly into a preallocated buffer
 
-def test_audio():
-    """Run audio test sequence"""
-    try:
-        print("Setting up DAC...")
-        if not setup_dac():
-            return False
-        
-        print("\nInitializing pygame audio...")
-        pygame.mixer.init(frequency=44100, size=-16, channels=1, buffer=2048)
-        
-        print("\nGenerating test tone...")
-        generate_test_tone()
-        
-        print("\nLoading and playing test tone...")
-        print("You should hear a 440 Hz tone (A4 note)")
-        
-        pygame.mixer.music.load('test_tone.wav')
-        pygame.mixer.music.set_volume(0.5)  # 50% volume
-        pygame.mixer.music.play()
-        
-        # Wait for the sound to finish
-        while pygame.mixer.music.get_busy():
-            time.sleep(0.1)
-        
-        print("\nTest completed successfully")
-        return True
-        
-    except Exception as e:
-        print(f"\nError during audio test: {e}")
-        return False
-    finally:
-        pygame.mixer.quit()
-        GPIO.cleanup()
+        Runs four interleaved stride-4 recurrences
+        s[n] = 2*cos(4w)*s[n-4] - s[n-8], one per SIMD lane, so LLVM can
+        vectorize the loop for the Pi's NEON unit. Lanes reseed every
+        4096 samples to stop rounding drift.
+        """
+        scale = amplitude * 32767.0
+        omega = 2.0 * math.pi * frequency / sample_rate
+        k4 = 2.0 * math.cos(4.0 * omega)
+        n = out.size
+        i = 0
+        while i < n:
+            end = min(i + 4096, n)
+            # Seed the four lanes two strides behind the block start
+            a1 = math.sin(omega * (i - 4))
+            a2 = math.sin(omega * (i - 8))
+            b1 = math.sin(omega * (i - 3))
+            b2 = math.sin(omega * (i - 7))
+            c1 = math.sin(omega * (i - 2))
+            c2 = math.sin(omega * (i - 6))
+            d1 = math.sin(omega * (i - 1))
+            d2 = math.sin(omega * (i - 5))
+            while i + 4 <= end:
+                a0 = k4 * a1 - a2
+                b0 = k4 * b1 - b2
+                c0 = k4 * c1 - c2
+                d0 = k4 * d1 - d2
+                out[i] = np.int16(scale * a0)
+                out[i + 1] = np.int16(scale * b0)
+                out[i + 2] = np.int16(scale * c0)
+                out[i + 3] = np.int16(scale * d0)
+                a2 = a1
+                a1 = a0
+                b2 = b1
+                b1 = b0
+                c2 = c1
+                c1 = c0
+                d2 = d1
+                d1 = d0
+                i += 4
+            while i < end:
+                out[i] = np.int16(scale * math.sin(omega * i))
+                i += 1
+else:
+    _fill_tone = None
 
-if __name__ == "__main__":
-    try:
-        print("Starting audio test...")
-        print("Make sure your headphones are connected and volume is at a moderate level")
-        input("Press Enter to begin test (Ctrl+C to cancel)...")
-        
-        test_audio()
-        
-    except KeyboardInterrupt:
-        print("\nTest cancelled by user")
-    finally:
-        pygame.mixer.quit()
-        GPIO.cleanup()#!/usr/bin/env python3
+_MIXER_READY = False
 
-import time
-import pygame
-import RPi.GPIO as GPIO
-import numpy as np
-import wave
-import struct
+def _ensure_mixer():
+    """Initialize pygame.mixer once; repeat runs skip the ALSA handshake"""
+    global _MIXER_READY
+    if not _MIXER_READY:
+        pygame.mixer.init(frequency=44100, size=-16, channels=1, buffer=2048)
+        atexit.register(pygame.mixer.quit)
+        _MIXER_READY = True
 
 def setup_dac():
     """Configure GPIO for the PCM5102A DAC"""
@@ -111,28 +89,54 @@ def setup_dac():
         return False
 
 def generate_test_tone():
-    """Generate a test tone WAV file"""
+    """Generate a test tone WAV file and return its path"""
     # Audio parameters
     sample_rate = 44100
     duration = 2  # seconds
     frequency = 440  # Hz (A4 note)
     amplitude = 0.5  # 50% volume
+
+    # The parameters are constants, so key the file by their hash and
+    # skip synthesis entirely when a previous run already wrote it
+    key = hashlib.blake2b(struct.pack(
+        '<iidd', sample_rate, duration, frequency, amplitude)).hexdigest()[:16]
+    path = f'test_tone_{key}.wav'
+    expected_bytes = 44 + 2 * int(duration * sample_rate)
+    if os.path.exists(path) and os.path.getsize(path) == expected_bytes:
+        return path
+
+    # Generate samples straight into an int16 buffer; the JIT kernel
+    # avoids the intermediate float64 arrays of the NumPy expression
+    samples = np.empty(int(duration * sample_rate), dtype=np.int16)
+    if _fill_tone is not None:
+        _fill_tone(samples, float(frequency), sample_rate, amplitude)
+    else:
+        # Endpoint-free float32 grid with amplitude folded into the
+        # scale: one pass, no float64 intermediates, no click at the end
+        phase = np.arange(samples.size, dtype=np.float32)
+        phase *= np.float32(2.0 * np.pi * frequency / sample_rate)
+        np.sin(phase, out=phase)
+        phase *= np.float32(amplitude * 32767.0)
+        samples[:] = phase.astype(np.int16, copy=False)
     
-    # Generate samples
-    samples = amplitude * np.sin(2.0 * np.pi * frequency * np.linspace(0, duration, int(duration * sample_rate)))
-    
-    # Convert to 16-bit integers
-    samples = (samples * 32767).astype(np.int16)
-    
-    # Write WAV file
-    with wave.open('test_tone.wav', 'w') as wav_file:
-        # Set parameters
-        wav_file.setnchannels(1)  # Mono
-        wav_file.setsampwidth(2)  # 2 bytes per sample
-        wav_file.setframerate(sample_rate)
-        
-        # Write data
-        wav_file.writeframes(samples.tobytes())
+    # Build the 44-byte RIFF header ourselves and hand header + PCM to
+    # the kernel in a single vectored write instead of the several small
+    # writes the wave module would make
+    data_len = samples.nbytes
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_len, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_len)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Pass the sample buffer's memoryview straight to writev;
+        # tobytes() would copy all of the PCM data first
+        os.writev(fd, [header, samples.data])
+    finally:
+        os.close(fd)
+
+    return path
 
 def test_audio():
     """Run audio test sequence"""
@@ -142,22 +146,33 @@ def test_audio():
             return False
         
         print("\nInitializing pygame audio...")
-        pygame.mixer.init(frequency=44100, size=-16, channels=1, buffer=2048)
-        
+        _ensure_mixer()
+
         print("\nGenerating test tone...")
-        generate_test_tone()
-        
+        tone_path = generate_test_tone()
+
         print("\nLoading and playing test tone...")
         print("You should hear a 440 Hz tone (A4 note)")
-        
-        pygame.mixer.music.load('test_tone.wav')
+
+        pygame.mixer.music.load(tone_path)
         pygame.mixer.music.set_volume(0.5)  # 50% volume
+
+        # Block on the end-of-playback event instead of polling
+        # get_busy(); the timer is a safety net if the event is missed
+        END = pygame.USEREVENT + 1
+        pygame.mixer.music.set_endevent(END)
         pygame.mixer.music.play()
-        
-        # Wait for the sound to finish
-        while pygame.mixer.music.get_busy():
-            time.sleep(0.1)
-        
+        try:
+            # loops= needs pygame >= 2.0; older builds raise TypeError
+            pygame.time.set_timer(END, 5000, loops=1)
+            while pygame.event.wait().type != END:
+                pass
+        except (pygame.error, TypeError):
+            # Event system unavailable (no display, or a pygame too old
+            # for one-shot timers); fall back to polling
+            while pygame.mixer.music.get_busy():
+                time.sleep(0.1)
+
         print("\nTest completed successfully")
         return True
         
@@ -165,7 +180,7 @@ def test_audio():
         print(f"\nError during audio test: {e}")
         return False
     finally:
-        pygame.mixer.quit()
+        # The mixer stays up for repeat runs; atexit quits it
         GPIO.cleanup()
 
 if __name__ == "__main__":
@@ -179,5 +194,4 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\nTest cancelled by user")
     finally:
-        pygame.mixer.quit()
         GPIO.cleanup()
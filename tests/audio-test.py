@@ -1,11 +1,40 @@
 #!/usr/bin/env python3
 
+import grp
+import math
 import os
+import stat
 import time
 import numpy as np
 import sounddevice as sd
 import RPi.GPIO as GPIO
-import subprocess
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; fall back to the NumPy synthesis path
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _fill_tone(out, frequency, sample_rate, amplitude, start):
+        """Fill a float32 block of sine tone beginning at sample `start`
+
+        Uses the two-tap recurrence s[n] = 2*cos(w)*s[n-1] - s[n-2] so
+        the inner loop is one multiply-subtract instead of a sin() call.
+        Reseeding at each block start keeps rounding drift bounded.
+        """
+        omega = 2.0 * math.pi * frequency / sample_rate
+        k = 2.0 * math.cos(omega)
+        s1 = math.sin(omega * (start - 1))
+        s2 = math.sin(omega * (start - 2))
+        for i in range(out.size):
+            s0 = k * s1 - s2
+            out[i] = amplitude * s0
+            s2 = s1
+            s1 = s0
+else:
+    _fill_tone = None
 
 class AudioDiagnostics:
     def __init__(self):
@@ -67,10 +96,12 @@ class AudioDiagnostics:
         try:
             print("\nALSA Configuration:")
             print("-----------------")
-            # Check aplay devices
-            aplay_output = subprocess.check_output(['aplay', '-l'], text=True)
-            print(aplay_output)
-            
+            # Read the card list straight from procfs; no aplay fork/exec
+            # needed and it works when alsa-utils isn't installed
+            with open('/proc/asound/cards') as f:
+                cards = f.read()
+            print(cards)
+
             # Check current ALSA config
             if os.path.exists('/etc/asound.conf'):
                 with open('/etc/asound.conf', 'r') as f:
@@ -78,30 +109,52 @@ class AudioDiagnostics:
                     print(f.read())
             else:
                 print("No /etc/asound.conf found")
-                
-            hifiberry_found = 'HiFiBerry' in aplay_output
-            self.print_result("ALSA Configuration", hifiberry_found, 
+
+            hifiberry_found = 'HiFiBerry' in cards or 'hifiberry' in cards
+            self.print_result("ALSA Configuration", hifiberry_found,
                             "HiFiBerry " + ("found" if hifiberry_found else "not found") + " in ALSA devices")
             return hifiberry_found
         except Exception as e:
             self.print_result("ALSA Configuration", False, f"Error: {str(e)}")
             return False
             
+    def _osc_cb(self, outdata, frames, time_info, status):
+        """Fill one output block from the running oscillator offset"""
+        start = self._osc_offset
+        n = min(frames, self._osc_total - start)
+        mono = outdata[:, 0]
+        if _fill_tone is not None:
+            _fill_tone(mono[:n], self._osc_freq, self.sample_rate, 0.5, start)
+        else:
+            phase = (start + np.arange(n, dtype=np.float32)) * np.float32(
+                2 * np.pi * self._osc_freq / self.sample_rate)
+            mono[:n] = 0.5 * np.sin(phase)
+        if n < frames:
+            mono[n:] = 0.0
+        self._osc_offset = start + n
+        if self._osc_offset >= self._osc_total:
+            raise sd.CallbackStop
+
     def test_sine_wave(self):
         """Test basic audio output with sine wave"""
         try:
             print("\nTesting audio output with sine wave...")
             print("You should hear a 440Hz tone for 2 seconds")
             
-            # Generate test tone
+            # Stream the tone block by block instead of materializing the
+            # whole 2-second buffer: memory use drops to one ALSA period
+            # and float32 blocks reach PortAudio without conversion
             duration = 2
-            frequency = 440
-            t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-            test_tone = 0.5 * np.sin(2 * np.pi * frequency * t)
-            
-            # Try to play the tone
-            sd.play(test_tone, self.sample_rate)
-            sd.wait()
+            self._osc_freq = 440.0
+            self._osc_total = int(self.sample_rate * duration)
+            self._osc_offset = 0
+
+            stream = sd.OutputStream(
+                samplerate=self.sample_rate, channels=1, dtype='float32',
+                blocksize=512, callback=self._osc_cb)
+            with stream:
+                while stream.active:
+                    time.sleep(0.05)
             
             # Ask for user confirmation
             response = input("Did you hear the tone? (y/n): ").lower().strip()
@@ -117,15 +170,17 @@ class AudioDiagnostics:
         """Check audio-related permissions"""
         try:
             print("\nChecking audio permissions:")
-            # Check audio group
-            groups_output = subprocess.check_output(['groups'], text=True)
-            audio_group_ok = 'audio' in groups_output
-            print(f"User groups: {groups_output.strip()}")
-            
-            # Check device permissions
-            ls_output = subprocess.check_output(['ls', '-l', '/dev/snd'], text=True)
+            # Resolve group membership via the grp database instead of
+            # forking `groups`
+            group_names = [grp.getgrgid(g).gr_name for g in os.getgroups()]
+            audio_group_ok = 'audio' in group_names
+            print(f"User groups: {' '.join(group_names)}")
+
+            # Check device permissions without forking `ls`
             print("\nAudio device permissions:")
-            print(ls_output)
+            for entry in sorted(os.scandir('/dev/snd'), key=lambda e: e.name):
+                mode = os.stat(entry.path).st_mode
+                print(f"{stat.filemode(mode)} {entry.name}")
             
             self.print_result("Audio Permissions", audio_group_ok, 
                             "User " + ("has" if audio_group_ok else "does not have") + " audio group permissions")
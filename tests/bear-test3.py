@@ -1,23 +1,54 @@
 #!/usr/bin/env python3
 
 import os
+import bisect
 import math
 import random
 import pygame
 import st7789
 import RPi.GPIO as GPIO
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+from PIL import Image, ImageChops, ImageDraw, ImageFont, ImageEnhance
 from time import sleep, time
 import sounddevice as sd
+import soundfile as sf
 import numpy as np
 import rtmidi
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from datetime import datetime
 import threading
 import configparser
+import queue
 import re
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; fall back to the NumPy mixing path
+    njit = None
+
+try:
+    import pigpio
+except ImportError:
+    # pigpio is optional; RPi.GPIO edge detection is the fallback
+    pigpio = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _mix_add(mix, data, pos, gain, n):
+        """Multiply-accumulate one voice into the mix buffer
+
+        Plain loops over contiguous stereo frames; LLVM vectorizes the
+        multiply-add for the Pi's NEON unit.
+        """
+        for i in range(n):
+            mix[i, 0] += data[pos + i, 0] * gain
+            mix[i, 1] += data[pos + i, 1] * gain
+else:
+    _mix_add = None
+
 # Initialize logging
 log_filename = f"bearsampler_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 logging.basicConfig(
@@ -27,12 +58,78 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+MAX_VOICES = 64
+
+class VoiceTable:
+    """Fixed-capacity structure-of-arrays voice pool
+
+    The realtime callback reads parallel arrays instead of chasing
+    per-object attribute lookups; finished voices are compacted with
+    swap-with-last so the first n entries are always the live ones.
+    """
+    def __init__(self, capacity=MAX_VOICES):
+        self.capacity = capacity
+        self.pos = np.zeros(capacity, dtype=np.int32)
+        self.length = np.zeros(capacity, dtype=np.int32)
+        # base_gain is the velocity term alone; gain folds in the master
+        # volume so the callback reads one number per voice
+        self.base_gain = np.zeros(capacity, dtype=np.float32)
+        self.gain = np.zeros(capacity, dtype=np.float32)
+        self.note = np.zeros(capacity, dtype=np.int16)
+        self.fadeout = np.zeros(capacity, dtype=bool)
+        self.data = [None] * capacity
+        self.n = 0
+
+    def allocate(self):
+        """Return a voice index, stealing the weakest voice when full"""
+        if self.n < self.capacity:
+            idx = self.n
+            self.n += 1
+            return idx
+        return self._steal()
+
+    def _steal(self):
+        """Pick the voice contributing least to the mix
+
+        Released (fading out) voices go first; otherwise the quietest
+        voice closest to its end is overwritten. Capacity stays fixed,
+        so callback cost is bounded no matter what the player does.
+        """
+        best = 0
+        best_score = None
+        for i in range(self.n):
+            if self.fadeout[i]:
+                score = 0.0
+            else:
+                remaining = 1.0 - self.pos[i] / max(int(self.length[i]), 1)
+                score = float(self.gain[i]) * remaining
+            if best_score is None or score < best_score:
+                best_score = score
+                best = i
+        return best
+
+    def retire(self, idx):
+        """Swap-with-last removal, O(1)"""
+        last = self.n - 1
+        self.data[idx] = self.data[last]
+        self.data[last] = None
+        self.pos[idx] = self.pos[last]
+        self.length[idx] = self.length[last]
+        self.base_gain[idx] = self.base_gain[last]
+        self.gain[idx] = self.gain[last]
+        self.note[idx] = self.note[last]
+        self.fadeout[idx] = self.fadeout[last]
+        self.n = last
+
 # Global state
 class GlobalState:
     def __init__(self):
         self.PRESET = 0
         self.samples = {}
-        self.playingsounds = []
+        # Per-note ([velocity thresholds], [sounds]) pairs sorted by
+        # velocity, so note-on maps any velocity to the nearest layer
+        self.velocity_layers = [None] * 128
+        self.voices = VoiceTable()
         self.playingnotes = {}
         self.sustainplayingnotes = []
         self.triggernotes = [128]*128
@@ -55,26 +152,78 @@ class GPIOManager:
     def __init__(self, button_config):
         self.buttons = button_config
         self.initialized = False
-        
+        self._pin_to_name = {pin: name for name, pin in button_config.items()}
+        # Debounced presses land here; the main loop drains them
+        self.events = queue.SimpleQueue()
+        self.pi = None
+        self._callbacks = []
+
     def initialize(self):
-        """Initialize GPIO pins"""
+        """Initialize GPIO pins with debounced edge detection"""
         try:
-            if not self.initialized:
-                GPIO.setmode(GPIO.BCM)
-                for button in self.buttons.values():
-                    GPIO.setup(button, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-                self.initialized = True
-                logging.info("GPIO initialized successfully")
+            if self.initialized:
                 return True
+
+            if pigpio is not None:
+                pi = pigpio.pi()
+                if pi.connected:
+                    # The daemon timestamps edges outside this process,
+                    # so button latency doesn't depend on our GIL and
+                    # the glitch filter debounces on hardware time
+                    self.pi = pi
+                    for button in self.buttons.values():
+                        pi.set_mode(button, pigpio.INPUT)
+                        pi.set_pull_up_down(button, pigpio.PUD_UP)
+                        pi.set_glitch_filter(button, 20000)  # 20 ms
+                        self._callbacks.append(pi.callback(
+                            button, pigpio.FALLING_EDGE,
+                            self._on_pigpio_edge))
+                    self.initialized = True
+                    logging.info("GPIO initialized via pigpio")
+                    return True
+                pi.stop()
+                logging.warning("pigpio daemon not running; using RPi.GPIO")
+
+            GPIO.setmode(GPIO.BCM)
+            for button in self.buttons.values():
+                GPIO.setup(button, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+                GPIO.add_event_detect(button, GPIO.FALLING,
+                                      callback=self._handle,
+                                      bouncetime=50)
+            self.initialized = True
+            logging.info("GPIO initialized successfully")
+            return True
         except Exception as e:
             logging.error(f"GPIO initialization error: {e}")
             return False
+
+    def _on_pigpio_edge(self, gpio, level, tick):
+        """pigpio edge callback; already glitch-filtered by the daemon"""
+        name = self._pin_to_name.get(gpio)
+        if name is not None:
+            self.events.put(name)
+
+    def _handle(self, pin):
+        """Edge callback: let the contact settle, re-read, then queue"""
+        sleep(0.002)
+        if GPIO.input(pin):
+            return  # bounce — the line is already back high
+        name = self._pin_to_name.get(pin)
+        if name is not None:
+            self.events.put(name)
             
     def cleanup(self):
         """Clean up GPIO resources"""
         if self.initialized:
             try:
-                GPIO.cleanup()
+                if self.pi is not None:
+                    for callback in self._callbacks:
+                        callback.cancel()
+                    self._callbacks = []
+                    self.pi.stop()
+                    self.pi = None
+                else:
+                    GPIO.cleanup()
                 self.initialized = False
                 logging.info("GPIO cleaned up successfully")
             except Exception as e:
@@ -89,34 +238,39 @@ class Sound:
         self.velocity = velocity
         self.mode = mode
         self.release = release
+        # Decoded lazily on first play; see SampleManager.touch
         self.data = None
-        self.load()
 
     def load(self):
         try:
-            audio_data, _ = sd.read(self.filename)
-            if len(audio_data.shape) == 1:
-                audio_data = np.column_stack((audio_data, audio_data))
-            self.data = audio_data
+            # Decode straight to float32 so the mixer never pays float64
+            # bandwidth or implicit casts; always_2d covers mono files
+            with sf.SoundFile(self.filename) as f:
+                audio_data = f.read(dtype='float32', always_2d=True)
+            if audio_data.shape[1] == 1:
+                audio_data = np.repeat(audio_data, 2, axis=1)
+            self.data = np.ascontiguousarray(audio_data, dtype=np.float32)
+            self.data.setflags(write=False)
             return True
         except Exception as e:
             logging.error(f"Error loading sample {self.filename}: {e}")
             return False
 
     def play(self, note, velocity):
-        sound = PlayingSound(self, note, velocity)
-        gv.playingsounds.append(sound)
-        return sound
-
-# PlayingSound class for active sound management
-class PlayingSound:
-    def __init__(self, sound, note, velocity):
-        self.sound = sound
-        self.pos = 0
-        self.note = note
-        self.velocity = velocity
-        self.fadeout = False
-        self.fadein = False
+        # Data is decoded by the caller beforehand; the audio thread
+        # must never touch the disk
+        if self.data is None:
+            return None
+        vt = gv.voices
+        idx = vt.allocate()
+        vt.data[idx] = self.data
+        vt.pos[idx] = 0
+        vt.length[idx] = len(self.data)
+        vt.base_gain[idx] = velocity / 127.0
+        vt.gain[idx] = vt.base_gain[idx] * gv.volume
+        vt.note[idx] = note
+        vt.fadeout[idx] = False
+        return idx
 
 # Main BearSampler class
 class BearSampler:
@@ -188,7 +342,8 @@ FALLBACK_SAMPLES_DIR = os.path.expanduser("~/BearSampler")
 CONFIG_DIR = "./config"
 
 # Hardware Configuration
-HARDWARE_CONFIG = {d     'DISPLAY': {
+HARDWARE_CONFIG = {
+    'DISPLAY': {
         'WIDTH': 240,
         'HEIGHT': 240,
         'ROTATION': 90,
@@ -222,40 +377,69 @@ class Sound:
         self.velocity = velocity
         self.mode = mode
         self.release = release
+        # Decoded lazily on first play; see SampleManager.touch
         self.data = None
-        self.load()
 
     def load(self):
         try:
-            audio_data, _ = sd.read(self.filename)
-            if len(audio_data.shape) == 1:
-                audio_data = np.column_stack((audio_data, audio_data))
-            self.data = audio_data
+            # Decode straight to float32 so the mixer never pays float64
+            # bandwidth or implicit casts; always_2d covers mono files
+            with sf.SoundFile(self.filename) as f:
+                audio_data = f.read(dtype='float32', always_2d=True)
+            if audio_data.shape[1] == 1:
+                audio_data = np.repeat(audio_data, 2, axis=1)
+            self.data = np.ascontiguousarray(audio_data, dtype=np.float32)
+            self.data.setflags(write=False)
             return True
         except Exception as e:
             logging.error(f"Error loading sample {self.filename}: {e}")
             return False
 
     def play(self, note, velocity):
-        sound = PlayingSound(self, note, velocity)
-        gv.playingsounds.append(sound)
-        return sound
-
-# PlayingSound class for active sound management
-class PlayingSound:
-    def __init__(self, sound, note, velocity):
-        self.sound = sound
-        self.pos = 0
-        self.note = note
-        self.velocity = velocity
-        self.fadeout = False
-        self.fadein = False
+        # Data is decoded by the caller beforehand; the audio thread
+        # must never touch the disk
+        if self.data is None:
+            return None
+        vt = gv.voices
+        idx = vt.allocate()
+        vt.data[idx] = self.data
+        vt.pos[idx] = 0
+        vt.length[idx] = len(self.data)
+        vt.base_gain[idx] = velocity / 127.0
+        vt.gain[idx] = vt.base_gain[idx] * gv.volume
+        vt.note[idx] = note
+        vt.fadeout[idx] = False
+        return idx
+
+# Matches e.g. "piano_60.wav"; the group is the MIDI note number
+_NOTE_RE = re.compile(r'^[^_]+_(\d{1,3})\.wav$', re.IGNORECASE)
 
 class SampleManager:
+    # Bounded cache of decoded sounds; the least recently played lose
+    # their data first. Voices keep their own reference to the array,
+    # so eviction never pulls samples out from under a playing note
+    MAX_LOADED = 64
+    _loaded = OrderedDict()
+    _loaded_lock = threading.Lock()
+
     def __init__(self):
         self.sample_path = Path(SAMPLES_DIR)
         self.fallback_path = Path(FALLBACK_SAMPLES_DIR)
 
+    @classmethod
+    def touch(cls, sound):
+        """Mark a sound recently used, evicting the coldest data
+
+        Called from both the MIDI thread and preset loading, so the
+        cache is guarded by a lock.
+        """
+        with cls._loaded_lock:
+            cls._loaded[id(sound)] = sound
+            cls._loaded.move_to_end(id(sound))
+            while len(cls._loaded) > cls.MAX_LOADED:
+                _, evicted = cls._loaded.popitem(last=False)
+                evicted.data = None
+
     def load_preset(self, preset_number):
         try:
             preset_dir = self.sample_path / str(preset_number)
@@ -268,19 +452,52 @@ class SampleManager:
             # Clear existing samples
             gv.samples.clear()
 
-            # Load all wav files in directory
-            for sample_file in preset_dir.glob("*.wav"):
+            files = list(preset_dir.glob("*.wav"))
+
+            def _load(sample_file):
                 try:
                     # Basic note extraction from filename
                     note = self.get_note_from_filename(sample_file.name)
                     if note is not None:
                         sound = Sound(str(sample_file), 1, note, 127)
-                        if (note, 127, 1) in gv.samples:
-                            gv.samples[note, 127, 1].append(sound)
-                        else:
-                            gv.samples[note, 127, 1] = [sound]
+                        # Warm-decode here so first presses find the
+                        # data already in memory
+                        sound.load()
+                        return note, sound
                 except Exception as e:
                     logging.error(f"Error loading sample {sample_file}: {e}")
+                return None
+
+            # Warm-decode in parallel; soundfile releases the GIL during
+            # its C-level reads, so workers overlap disk I/O with
+            # decoding. Results are folded into gv.samples and the LRU
+            # cache on this thread only
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for result in executor.map(_load, files):
+                    if result is None:
+                        continue
+                    note, sound = result
+                    self.touch(sound)
+                    if (note, 127, 1) in gv.samples:
+                        gv.samples[note, 127, 1].append(sound)
+                    else:
+                        gv.samples[note, 127, 1] = [sound]
+
+            # Rebuild the per-note velocity layers for the new preset.
+            # Any incoming velocity then resolves to the layer with the
+            # nearest threshold at or above it, instead of requiring an
+            # exact key match
+            layers = [None] * 128
+            for (note, velocity, _voice), sounds in gv.samples.items():
+                if layers[note] is None:
+                    layers[note] = []
+                layers[note].append((velocity, sounds[0]))
+            for note, entries in enumerate(layers):
+                if entries is not None:
+                    entries.sort(key=lambda e: e[0])
+                    layers[note] = ([v for v, _ in entries],
+                                    [s for _, s in entries])
+            gv.velocity_layers = layers
 
             return True
 
@@ -290,14 +507,12 @@ class SampleManager:
 
     @staticmethod
     def get_note_from_filename(filename):
-        """Extract MIDI note from filename"""
-        try:
-            note = int(filename.split('_')[1].split('.')[0])
-            if 0 <= note <= 127:
-                return note
-        except:
+        """Extract MIDI note from filename, or None if it doesn't match"""
+        m = _NOTE_RE.match(filename)
+        if not m:
             return None
-        return None
+        note = int(m.group(1))
+        return note if 0 <= note <= 127 else None
 
 # Continue with Display, MIDI, and Audio engine classes...
 
@@ -327,11 +542,41 @@ class DisplayManager:
         
         self.initialize()
 
+        # Rendering and the SPI push happen on a dedicated thread so
+        # display work never steals time from the MIDI/audio path. The
+        # one-slot queue coalesces updates: only the freshest state gets
+        # drawn and callers never block
+        self._q = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            state = self._q.get()
+            try:
+                self._render(state)
+            except Exception as e:
+                logging.error(f"Display render error: {e}")
+
     def initialize(self):
         """Initialize display and load fonts"""
         try:
             self.disp.begin()
             self.load_fonts()
+            # Solid background rendered once; every screen starts from
+            # a copy instead of repainting the fill
+            self._base_image = Image.new(
+                'RGB', (self.width, self.height), self.colors['background'])
+            # Word widths are measured once and cached for the error
+            # screen's wrap
+            self._measure_draw = ImageDraw.Draw(self._base_image)
+            self._word_w = {}
+            self._space_w = self._measure_draw.textlength(
+                ' ', font=self.font_small)
+            # Dirty-region blits need the driver's raw window/send API
+            self._prev_image = None
+            self._partial_blit = (hasattr(self.disp, 'set_window')
+                                  and hasattr(self.disp, 'send'))
             return True
         except Exception as e:
             logging.error(f"Display initialization error: {e}")
@@ -353,8 +598,15 @@ class DisplayManager:
             self.font_small = ImageFont.load_default()
 
     def update_display(self, state):
-        """Update display with current state"""
-        image = Image.new('RGB', (self.width, self.height), self.colors['background'])
+        """Queue a display update; stale frames are dropped"""
+        try:
+            self._q.put_nowait(state)
+        except queue.Full:
+            pass
+
+    def _render(self, state):
+        """Draw the current state; runs on the display thread"""
+        image = self._base_image.copy()
         draw = ImageDraw.Draw(image)
 
         # Draw preset information
@@ -364,7 +616,7 @@ class DisplayManager:
                  fill=self.colors['text'])
 
         # Draw playing notes count
-        notes_text = f"Active Notes: {len(state.playingsounds)}"
+        notes_text = f"Active Notes: {state.voices.n}"
         draw.text((20, 60), notes_text,
                  font=self.font_small,
                  fill=self.colors['text'])
@@ -375,11 +627,11 @@ class DisplayManager:
                  font=self.font_small,
                  fill=self.colors['crystal'])
 
-        self.disp.display(image)
+        self._push(image)
 
     def show_loading(self, message):
         """Show loading screen"""
-        image = Image.new('RGB', (self.width, self.height), self.colors['background'])
+        image = self._base_image.copy()
         draw = ImageDraw.Draw(image)
         
         draw.text((20, 110), "Loading...",
@@ -389,30 +641,75 @@ class DisplayManager:
         draw.text((20, 140), message,
                  font=self.font_small,
                  fill=self.colors['text'])
-        
+
+        self._push(image)
+
+    def _push(self, image):
+        """Push a frame, sending only the changed window when small"""
+        prev = self._prev_image
+        self._prev_image = image
+        if self._partial_blit and prev is not None:
+            try:
+                bbox = ImageChops.difference(image, prev).getbbox()
+                if bbox is None:
+                    return  # frame is identical to the last one
+                x0, y0, x1, y1 = bbox
+                # A full refresh is cheaper once more than half the
+                # panel has changed
+                if (x1 - x0) * (y1 - y0) * 2 <= self.width * self.height:
+                    buf = self._to_rgb565(image.crop(bbox))
+                    self.disp.set_window(x0, y0, x1 - 1, y1 - 1)
+                    self.disp.send(buf, True, chunk_size=len(buf))
+                    return
+            except Exception as e:
+                logging.warning(f"Partial display update failed: {e}")
+                self._partial_blit = False
         self.disp.display(image)
 
+    @staticmethod
+    def _to_rgb565(image):
+        """Pack a PIL image into the panel's big-endian RGB565 bytes"""
+        arr = np.asarray(image.convert('RGB')).astype(np.uint16)
+        packed = (((arr[..., 0] >> 3) << 11)
+                  | ((arr[..., 1] >> 2) << 5)
+                  | (arr[..., 2] >> 3))
+        return packed.astype('>u2').tobytes()
+
+    def _word_width(self, word):
+        """Measure a word's pixel width once and cache it"""
+        w = self._word_w.get(word)
+        if w is None:
+            bbox = self._measure_draw.textbbox((0, 0), word,
+                                               font=self.font_small)
+            w = bbox[2] - bbox[0]
+            self._word_w[word] = w
+        return w
+
     def show_error(self, error_message):
         """Show error screen"""
-        image = Image.new('RGB', (self.width, self.height), self.colors['background'])
+        image = self._base_image.copy()
         draw = ImageDraw.Draw(image)
         
         draw.text((20, 100), "Error:",
                  font=self.font_large,
                  fill=self.colors['accent'])
         
-        # Word wrap error message
+        # Greedy wrap on cached word widths; each distinct word is
+        # measured once instead of re-measuring the growing line
         words = error_message.split()
         lines = []
         current_line = []
+        current_w = 0
         for word in words:
-            current_line.append(word)
-            test_line = ' '.join(current_line)
-            bbox = draw.textbbox((0, 0), test_line, 
-                               font=self.font_small)
-            if bbox[2] - bbox[0] > 200:
-                lines.append(' '.join(current_line[:-1]))
+            w = self._word_width(word)
+            needed = w if not current_line else current_w + self._space_w + w
+            if current_line and needed > 200:
+                lines.append(' '.join(current_line))
                 current_line = [word]
+                current_w = w
+            else:
+                current_line.append(word)
+                current_w = needed
         if current_line:
             lines.append(' '.join(current_line))
         
@@ -422,8 +719,8 @@ class DisplayManager:
                      font=self.font_small,
                      fill=self.colors['text'])
             y += 20
-        
-        self.disp.display(image) 
+
+        self._push(image)
 
 class AudioEngine:
     def __init__(self, config):
@@ -434,6 +731,17 @@ class AudioEngine:
         self.stream = None
         self.volume = 0.8
 
+        # Reusable scratch buffer; the realtime callback must not
+        # allocate. Mixing itself happens in place in PortAudio's
+        # outdata buffer
+        self._tmp = np.empty((self.blocksize, self.channels),
+                             dtype=np.float32)
+
+        # Note commands are posted here from the MIDI thread and drained
+        # at the top of each callback, so the voice list is only mutated
+        # on the audio thread (rtmixer-style command queue)
+        self._commands = queue.SimpleQueue()
+
     def initialize(self):
         """Initialize audio system"""
         try:
@@ -441,14 +749,38 @@ class AudioEngine:
             sd.default.channels = self.channels
             sd.default.blocksize = self.blocksize
             
-            self.stream = sd.OutputStream(
-                channels=self.channels,
-                callback=self.audio_callback,
-                samplerate=self.sample_rate,
-                blocksize=self.blocksize
-            )
-            self.stream.start()
-            logging.info("Audio engine initialized successfully")
+            if _mix_add is not None:
+                # Trigger JIT compilation before the stream starts so
+                # the first callback never pays the compile cost
+                warm = np.zeros((1, 2), dtype=np.float32)
+                _mix_add(warm, warm, 0, 0.0, 1)
+
+            # Ask for low latency and the smallest power-of-two block
+            # the host accepts; escalate when PortAudio refuses one
+            for blocksize in (256, 512, 1024):
+                try:
+                    stream = sd.OutputStream(
+                        channels=self.channels,
+                        callback=self.audio_callback,
+                        samplerate=self.sample_rate,
+                        blocksize=blocksize,
+                        dtype=self.format,
+                        latency='low'
+                    )
+                    stream.start()
+                except sd.PortAudioError as e:
+                    logging.warning(f"Blocksize {blocksize} rejected: {e}")
+                    continue
+                self.stream = stream
+                self.blocksize = blocksize
+                sd.default.blocksize = blocksize
+                break
+
+            if self.stream is None:
+                raise RuntimeError("No workable audio blocksize")
+
+            logging.info(
+                f"Audio engine initialized (blocksize {self.blocksize})")
             return True
         except Exception as e:
             logging.error(f"Audio initialization error: {e}")
@@ -460,49 +792,102 @@ class AudioEngine:
             logging.warning(f"Audio callback status: {status}")
         
         try:
-            # Initialize output buffer
-            mixed = np.zeros((frames, self.channels), dtype=np.float32)
-            
-            # Mix all active sounds
-            for sound in gv.playingsounds[:]:  # Copy list as we might modify it
-                if sound.pos >= len(sound.sound.data):
-                    gv.playingsounds.remove(sound)
+            self._drain_commands()
+
+            # Mix straight into PortAudio's output buffer; no
+            # block-sized intermediate at all
+            mixed = outdata
+            tmp = self._tmp
+            mixed.fill(0.0)
+
+            # Mix all active voices from the table's parallel arrays;
+            # finished voices compact with swap-with-last
+            vt = gv.voices
+            i = 0
+            while i < vt.n:
+                pos = int(vt.pos[i])
+                length = int(vt.length[i])
+                if pos >= length:
+                    vt.retire(i)
                     continue
-                
+
                 # Calculate remaining samples
-                available = len(sound.sound.data) - sound.pos
-                n_samples = min(frames, available)
-                
-                # Apply volume and velocity scaling
-                gain = (sound.velocity / 127.0) * self.volume
-                
-                # Mix into output buffer
-                mixed[:n_samples] += sound.sound.data[sound.pos:sound.pos + n_samples] * gain
-                
+                n_samples = min(frames, length - pos)
+
+                # Gain was folded together at note-on; just read it
+                gain = float(vt.gain[i])
+
+                # Accumulate through the JIT kernel when available; the
+                # NumPy fallback scales into the scratch buffer so no
+                # temporaries are created in the realtime path
+                data = vt.data[i]
+                if _mix_add is not None:
+                    _mix_add(mixed, data, pos, gain, n_samples)
+                else:
+                    np.multiply(data[pos:pos + n_samples], gain,
+                                out=tmp[:n_samples])
+                    np.add(mixed[:n_samples], tmp[:n_samples],
+                           out=mixed[:n_samples])
+
                 # Update position
-                sound.pos += n_samples
+                vt.pos[i] = pos + n_samples
+                i += 1
+
+            # Clip in place; the mix is already in the output buffer
+            np.clip(mixed, -1.0, 1.0, out=mixed)
 
-            # Prevent clipping
-            mixed = np.clip(mixed, -1.0, 1.0)
-            outdata[:] = mixed
-            
         except Exception as e:
             logging.error(f"Audio callback error: {e}")
             outdata.fill(0)
 
+    def _drain_commands(self):
+        """Apply queued note commands; runs on the audio thread only"""
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            if command[0] == 'on':
+                # The sound was resolved and decoded before it was
+                # queued; starting the voice is all that happens here
+                command[1].play(command[2], command[3])
+            else:
+                note = command[1]
+                vt = gv.voices
+                for i in range(vt.n):
+                    if vt.note[i] == note:
+                        vt.fadeout[i] = True
+
     def note_on(self, note, velocity):
-        """Start playing a note"""
-        try:
-            if (note, velocity, 1) in gv.samples:
-                gv.samples[note, velocity, 1][0].play(note, velocity)
-        except Exception as e:
-            logging.error(f"Note on error: {e}")
+        """Resolve and decode the sample, then queue the note start
+
+        Runs on the caller's (MIDI) thread so any lazy disk read and
+        decode happens here — the audio callback only ever sees sounds
+        whose data is already in memory.
+        """
+        layers = gv.velocity_layers[note]
+        if layers is None:
+            return
+        thresholds, sounds = layers
+        idx = bisect.bisect_left(thresholds, velocity)
+        if idx == len(sounds):
+            idx -= 1
+        sound = sounds[idx]
+        if sound.data is None and not sound.load():
+            return
+        SampleManager.touch(sound)
+        self._commands.put(('on', sound, note, velocity))
 
     def note_off(self, note):
-        """Stop playing a note"""
-        for sound in gv.playingsounds[:]:
-            if sound.note == note:
-                sound.fadeout = True
+        """Queue a note stop; safe to call from any thread"""
+        self._commands.put(('off', note))
+
+    def set_volume(self, volume):
+        """Set master volume and rescale the gains of live voices"""
+        self.volume = max(0.0, min(1.0, volume))
+        gv.volume = self.volume
+        vt = gv.voices
+        np.multiply(vt.base_gain[:vt.n], self.volume, out=vt.gain[:vt.n])
 
     def cleanup(self):
         """Clean up audio resources"""